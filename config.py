@@ -0,0 +1,26 @@
+# config.py
+# Shared font namespace - Mark Harris
+# Version 2.2
+# Part of Epaper Display project found at; https://github.com/markyharris/metar/
+#
+# metar_main assigns get_font() here at startup and the layout routines pull
+# fonts through this module on demand. The fontNN / fontNNb attributes the
+# layouts reference are served lazily (PEP 562 __getattr__): the first access
+# builds that one size and caches it on the module, so sizes a layout never
+# uses are never loaded.
+
+get_font = None # assigned by metar_main at startup
+
+
+def __getattr__(name):
+    # Resolve font16, font24b, font48, ... on first use
+    if name.startswith("font") and get_font is not None:
+        size_part = name[4:]
+        bold = size_part.endswith("b")
+        if bold:
+            size_part = size_part[:-1]
+        if size_part.isdigit():
+            font = get_font(int(size_part), bold)
+            globals()[name] = font # cache so later accesses skip __getattr__
+            return font
+    raise AttributeError(f"module 'config' has no attribute '{name}'")
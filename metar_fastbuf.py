@@ -0,0 +1,114 @@
+# metar_fastbuf.py
+# Fast 4-gray framebuffer packing - Mark Harris
+# Version 2.2
+# Part of Epaper Display project found at; https://github.com/markyharris/metar/
+#
+# Drop-in replacement for epd.getbuffer_4Gray(), which walks every pixel in a
+# Python loop to pack four 2-bit gray codes per byte. Here the image is pulled
+# into NumPy once, quantized to 2-bit codes, and packed by a kernel that Numba
+# compiles to machine code when installed (@njit, cached on disk); without
+# Numba a vectorized NumPy fallback does the same packing.
+
+import numpy as np
+
+# Kernel preference: the AOT-built module (see metar_fastbuf_aot.py) loads
+# instantly; failing that, JIT with Numba; failing that, vectorized NumPy.
+try:
+    import metar_fastbuf_c
+    HAVE_AOT = True
+except ImportError:
+    HAVE_AOT = False
+
+try:
+    from numba import njit, prange, set_num_threads
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    try:
+        set_num_threads(4) # quad-core Pi; no-op benefit beyond core count
+    except ValueError:
+        pass # fewer threads available than requested
+
+
+# Bin edges mapping 8-bit pixels to the driver's 2-bit codes: 0xFF
+# (GRAY1/white) -> 3, 0xC0 (GRAY2) -> 2, 0x80 (GRAY3) -> 1, 0x00
+# (GRAY4/black) -> 0. The edges sit midway between the four panel levels, so
+# the exact GRAY values land where getbuffer_4Gray put them and anything in
+# between snaps to the nearest level instead of keying off its top two bits.
+_BINS = np.array([0x40, 0xA0, 0xE0], dtype=np.uint8)
+
+
+def _quantize(arr):
+    # np.digitize is a branchless searchsorted over the three edges -
+    # no per-pixel comparisons in Python, vectorizes well on ARM
+    return np.digitize(arr, _BINS).astype(np.uint8)
+
+
+def _pack_words_py(v32, out):
+    # SWAR pack: each uint32 word holds four 2-bit codes (little-endian, so
+    # pixel 0 sits in the low byte); merge them into one output byte with
+    # pixel 0 in the top two bits, MSB first as the panel expects.
+    for i in range(v32.size):
+        x = v32[i]
+        out[i] = (((x & 3) << 6) | (((x >> 8) & 3) << 4) |
+                  (((x >> 16) & 3) << 2) | ((x >> 24) & 3))
+
+
+def _pack_words_np(v32, out):
+    np.copyto(out, ((((v32 & 3) << 6) | (((v32 >> 8) & 3) << 4) |
+                     (((v32 >> 16) & 3) << 2) | ((v32 >> 24) & 3))
+                    ).astype(np.uint8), casting='unsafe')
+
+
+if HAVE_AOT:
+    _pack_words = metar_fastbuf_c.pack_words
+elif HAVE_NUMBA:
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _pack_words(v32, out):
+        # Same SWAR collapse as _pack_words_py, with prange splitting the
+        # word range across cores - every output byte is independent
+        for i in prange(v32.size):
+            x = v32[i]
+            out[i] = (((x & 3) << 6) | (((x >> 8) & 3) << 4) |
+                      (((x >> 16) & 3) << 2) | ((x >> 24) & 3))
+else:
+    _pack_words = _pack_words_np
+
+# Two output buffers, used alternately: the main loop hands the previous
+# frame's buffer to a background display flush, so the next pack must not
+# write into the bytes that thread is still reading.
+_out_buffers = [None, None]
+_out_index = 0
+
+
+def pack_4gray(image):
+    """Return the packed 4-gray framebuffer for a full-frame L-mode image.
+
+    Equivalent to epd.getbuffer_4Gray(image) but without the per-pixel
+    Python loop. The returned buffer is owned by this module and reused
+    every other call - consume it (or copy it) before packing two more
+    frames.
+    """
+    global _out_index
+    arr = np.asarray(image, dtype=np.uint8)
+    h, w = arr.shape
+    size = (w * h) >> 2
+
+    out = _out_buffers[_out_index]
+    if out is None or out.size != size:
+        out = np.empty(size, dtype=np.uint8)
+        _out_buffers[_out_index] = out
+    _out_index ^= 1
+
+    # View the code array as one uint32 per output byte; width 400 keeps
+    # every row a multiple of four pixels
+    _pack_words(_quantize(arr).reshape(-1).view(np.uint32), out)
+    return out
+
+
+def warm_up(width=400, height=300):
+    """Pack one dummy frame so Numba's JIT compile (or cache load) happens
+    at startup instead of delaying the first real refresh."""
+    pack_4gray(np.full((height, width), 0xFF, dtype=np.uint8))
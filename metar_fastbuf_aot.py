@@ -0,0 +1,24 @@
+# metar_fastbuf_aot.py
+# AOT build for the framebuffer pack kernel - Mark Harris
+# Version 2.2
+# Part of Epaper Display project found at; https://github.com/markyharris/metar/
+#
+# Run once at install time:
+#   python metar_fastbuf_aot.py
+# to compile the pack kernel into metar_fastbuf_c.so next to this file.
+# metar_fastbuf prefers that module when it exists, so startup pays neither
+# a JIT compile nor a disk-cache load before the first refresh.
+
+from numba.pycc import CC
+
+from metar_fastbuf import _pack_words_py
+
+cc = CC('metar_fastbuf_c')
+cc.verbose = True
+
+# Serial SWAR kernel with an explicit signature; the prange-parallel
+# variant can't be AOT-exported
+cc.export('pack_words', 'void(uint32[::1], uint8[::1])')(_pack_words_py)
+
+if __name__ == '__main__':
+    cc.compile()
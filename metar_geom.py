@@ -0,0 +1,45 @@
+# metar_geom.py
+# Wind arrow geometry kernel - Mark Harris
+# Version 2.1
+# Part of Epaper Display project found at; https://github.com/markyharris/metar/
+#
+# Computes the rotated wind-arrow polygon points for metar_layouts.layout_wind.
+# The point math is pure numeric code, so when Numba is installed it gets
+# compiled to machine code (@njit, cached on disk so the compile cost is paid
+# once); without Numba the same function runs as plain Python/NumPy.
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def _arrow_points_py(cos_a, sin_a, near_half_w, far_half_w, shaft_half_l,
+                     head_half_w, head_base_y, head_tip_y, cx, cy):
+    # Returns a (7,2) int32 array of screen coordinates: the four shaft
+    # trapezoid corners first, then tip / base-left / base-right of the head.
+    pts = np.empty((7, 2), dtype=np.float32)
+    pts[0, 0] = -far_half_w;  pts[0, 1] = -shaft_half_l  # tail left
+    pts[1, 0] =  far_half_w;  pts[1, 1] = -shaft_half_l  # tail right
+    pts[2, 0] =  near_half_w; pts[2, 1] =  shaft_half_l  # head base right
+    pts[3, 0] = -near_half_w; pts[3, 1] =  shaft_half_l  # head base left
+    pts[4, 0] = 0.0;          pts[4, 1] =  head_tip_y    # tip
+    pts[5, 0] = -head_half_w; pts[5, 1] =  head_base_y   # head corner 1
+    pts[6, 0] =  head_half_w; pts[6, 1] =  head_base_y   # head corner 2
+
+    out = np.empty((7, 2), dtype=np.int32)
+    for i in range(7):
+        x = pts[i, 0]
+        y = pts[i, 1]
+        out[i, 0] = np.int32(x * cos_a - y * sin_a + cx)
+        out[i, 1] = np.int32(x * sin_a + y * cos_a + cy)
+    return out
+
+
+if HAVE_NUMBA:
+    arrow_points = njit(cache=True)(_arrow_points_py)
+else:
+    arrow_points = _arrow_points_py
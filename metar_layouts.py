@@ -10,23 +10,102 @@
 from metar_routines import *
 from metar_settings import * # Keep for settings variables if needed
 from datetime import datetime, timedelta
+from collections import OrderedDict, namedtuple
+import itertools
 import random
 import math
+import numpy as np
+from metar_geom import arrow_points
 # Import PIL directly if needed for fonts (but fonts should be passed from main)
 from PIL import Image, ImageDraw, ImageFont
 import os # For font paths if loaded locally
+import logging
 import config
 
+log = logging.getLogger(__name__) # per-frame debug chatter stays off unless enabled
+
+# aggdraw (optional) rasterizes convex polygons much faster and antialiased;
+# only used for the one-shot runway sprite build, so it stays optional
+try:
+    import aggdraw
+except ImportError:
+    aggdraw = None
+
 # Misc Variables
 d = " " # delimiter
-cycle_num = 0
-pref_cycle = 0
+
+# Decoded METAR cache
+# The layouts get re-dispatched every refresh cycle but the METAR itself only
+# changes every few minutes, so cache the decoded fields keyed on the raw text
+# and the unit settings. Small OrderedDict LRU so stale observations age out.
+DecodedMetar = namedtuple('DecodedMetar', ['flightcategory', 'airport', 'decoded_wndir', 'decoded_wnspd',
+                                           'descript', 'cctype_lst', 'ccheight_lst', 'dis_unit',
+                                           'vis', 'vis_unit', 'tempf', 'temp_unit'])
+_decode_cache = OrderedDict()
+_DECODE_CACHE_MAX = 4
+
+def _get_decoded(metar, raw_metar_text, cloud_layer_units, visibility_units, temperature_units):
+    key = (raw_metar_text, cloud_layer_units, visibility_units, temperature_units)
+    if key in _decode_cache:
+        _decode_cache.move_to_end(key)
+        return _decode_cache[key]
+
+    decoded_airport, decoded_time, decoded_wndir, decoded_wnspd, decoded_wngust, decoded_vis, \
+        decoded_alt, decoded_temp, decoded_dew, decoded_cloudlayers, decoded_weather, decoded_rvr \
+        = decode_rawmessage(raw_metar_text)
+    flightcategory, icon = flight_category(metar)
+    airport = decoded_airport if decoded_airport else "N/A"
+    descript = get_wxstring(metar)
+    cctype_lst, ccheight_lst, dis_unit = get_clouds(metar, cloud_layer_units)
+    vis, vis_unit = get_visib(metar, visibility_units)
+    tempf, temp_unit = get_temp(metar, temperature_units)
+
+    decoded = DecodedMetar(flightcategory, airport, decoded_wndir, decoded_wnspd, descript,
+                           cctype_lst, ccheight_lst, dis_unit, vis, vis_unit, tempf, temp_unit)
+    _decode_cache[key] = decoded
+    while len(_decode_cache) > _DECODE_CACHE_MAX:
+        _decode_cache.popitem(last=False)
+    return decoded
+
+
+# Text measurement goes straight through font.getbbox - cheaper than
+# draw.textbbox (no draw-context lookup) and avoids the deprecated
+# draw.textsize fallback with its different size convention.
+def _measure(text, font):
+    l, t, r, b = font.getbbox(text)
+    return (r - l, b - t)
+
+# Pre-measured text sizes for strings that never change (flight category,
+# runway numbers). Measuring goes through FreeType shaping every call, so do
+# it once and look the sizes up afterwards. The fonts are assigned to config
+# by metar_main after this module is imported, so the tables are filled on
+# first use rather than at import time.
+_FC_SIZE = {}
+_RWY_SIZE = {}
+
+def _fc_size(text, font):
+    if not _FC_SIZE:
+        for fc in ("VFR", "MVFR", "IFR", "LIFR", "N/A"):
+            _FC_SIZE[fc] = _measure(fc, font)
+    if text in _FC_SIZE:
+        return _FC_SIZE[text]
+    return _measure(text, font) # fall back to measuring on a miss
+
+def _rwy_size(text, font):
+    if not _RWY_SIZE:
+        for n in range(1, 37):
+            num = f"{n:02d}"
+            _RWY_SIZE[num] = _measure(num, font)
+    if text in _RWY_SIZE:
+        return _RWY_SIZE[text]
+    return _measure(text, font) # fall back to measuring on a miss
+
 
 # Utility routines
 # These need modification if they used the 'display' object's methods
-def center_line_pil(draw, width, text, font): # Pass draw context and total width
-    w, h = draw.textsize(text, font=font)
-    return int((width - w) / 2) # Return X coordinate
+def center_line_pil(width, text, font): # Pass total width
+    w, h = _measure(text, font) # draw.textsize is gone in Pillow 10
+    return (width - w) // 2 # Return X coordinate
 
 def last_update():
     now = datetime.now()
@@ -34,6 +113,24 @@ def last_update():
     last_update = "Last Updated at "+now.strftime("%H:%M %Z") # 24-hour + timezone
     return last_update
 
+# Footer timestamp cache - the "Last Updated at HH:MM" line only changes once
+# per minute, but the footer used to be shaped and rasterized on every layout
+# cycle. Render it to a small L-mode bitmap when the minute rolls over and
+# just paste that bitmap on the cycles in between.
+_footer_cache = {"minute": None, "img": None, "ink_h": 0}
+
+def _footer_image(font, fill, bg):
+    minute = datetime.now().strftime("%H:%M")
+    if _footer_cache["minute"] != minute:
+        update_text = last_update()
+        l, t, r, b = font.getbbox(update_text) # need the raw bbox for ink height
+        img = Image.new("L", (r - l + 2, b), bg)
+        ImageDraw.Draw(img).text((0, 0), update_text, fill=fill, font=font)
+        _footer_cache["minute"] = minute
+        _footer_cache["img"] = img
+        _footer_cache["ink_h"] = b - t
+    return _footer_cache["img"], _footer_cache["ink_h"]
+
 # check_preferred_layout remains the same as it doesn't use display object
 
 # disp_ip needs significant changes if used, as it relied heavily on 'display'
@@ -41,50 +138,148 @@ def last_update():
 # def disp_ip(epd, Limage, draw, ip_address): ...
 
 
-# cycle_layout needs update to accept and pass epd, Limage, draw
-def cycle_layout(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units, layout_list, preferred_layouts, use_preferred):
-    global cycle_num, pref_cycle
-
-    if use_preferred == 1:
-        p_layouts_lst = [int(a) for a in str(preferred_layouts)]
-        # print('p_layouts_lst:',p_layouts_lst) # debug
-        if not p_layouts_lst:
-             print("Error: Preferred layout list is empty or invalid.")
-             # Optionally draw error message on Limage
-             return
-
-        current_pref_index = pref_cycle % len(p_layouts_lst)
-        layout_index_to_use = p_layouts_lst[current_pref_index]
-
-        if 0 <= layout_index_to_use < len(layout_list):
-             print(f'\033[96m!!! Preferred Layout Index: {layout_index_to_use} IN LIST !!!\033[0m')
-             cycle_pick = layout_list[layout_index_to_use]
-             # Call with the new signature
-             cycle_pick(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units)
-             pref_cycle = (pref_cycle + 1) # Cycle through preferred list
+# Sine/cosine lookup table for the arrow rotation. Wind direction and runway
+# heading are whole degrees, so the relative angle only ever takes the 361
+# values in [-180, 180]; index with angle + 180 instead of calling
+# math.radians/sin/cos every frame.
+_SINCOS = [(math.sin(math.radians(d)), math.cos(math.radians(d))) for d in range(-180, 181)]
+
+# Pre-rendered stamps for the fixed runway markings. The threshold ticks and
+# centerline dashes never move, so rasterize them once at import into small
+# white-on-black images and paste them each frame - one blit apiece instead
+# of ten draw.line calls. Each stamp doubles as its own paste mask so only
+# the white marking pixels land on the runway.
+_THRESHOLD_STAMP = Image.new("L", (51, 6), 0)
+_stamp_draw = ImageDraw.Draw(_THRESHOLD_STAMP)
+for _x_offset in [-25, -18, -11, -4, 4, 11, 18, 25]:
+    _stamp_draw.line((_x_offset + 25, 0, _x_offset + 25, 5), fill=255, width=1)
+
+# Centerline dash (start_y, end_y) pairs, constant-folded from the old
+# per-frame while loop (6 px dash, 4 px gap, two dashes)
+_CENTERLINE_DASHES = [(0, 6), (10, 16)]
+_CENTERLINE_STAMP = Image.new("L", (2, 17), 0)
+_stamp_draw = ImageDraw.Draw(_CENTERLINE_STAMP)
+for _y0, _y1 in _CENTERLINE_DASHES:
+    _stamp_draw.line((0, _y0, 0, _y1), fill=255, width=2)
+del _stamp_draw
+
+# Runway geometry - fixed for layout_wind, shared by the sprite builder below
+_RUNWAY_NUMBER = 18
+_RUNWAY_WIDTH_NEAR = 85
+_RUNWAY_WIDTH_FAR = 50
+_RUNWAY_LENGTH = 55
+
+# The whole runway graphic (trapezoid, centerline dashes, threshold ticks and
+# runway number) is geometrically fixed, so rasterize it once into a cached
+# sprite and paste that each frame; only the wind arrow stays dynamic. Built
+# lazily because the runway-number text needs the fonts metar_main loads
+# into config after importing this module.
+_runway_sprite_cache = {"img": None, "mask": None}
+
+def _get_runway_sprite():
+    if _runway_sprite_cache["img"] is None:
+        half_near = _RUNWAY_WIDTH_NEAR // 2
+        half_far = _RUNWAY_WIDTH_FAR // 2
+        half_len = _RUNWAY_LENGTH // 2
+        cx, base = half_near + 1, half_len + 1
+        size = (2 * cx + 1, 2 * base + 1)
+        sprite = Image.new("L", size, 255)
+        mask = Image.new("L", size, 0)
+        trapezoid = [(cx - half_near, base + half_len), (cx - half_far, base - half_len),
+                     (cx + half_far, base - half_len), (cx + half_near, base + half_len)]
+        if aggdraw is not None:
+            # aggdraw's convex fill is faster and antialiases the slanted
+            # edges; a one-shot cost since the sprite is built exactly once
+            agg = aggdraw.Draw(sprite)
+            agg.polygon(tuple(c for p in trapezoid for c in p), None, aggdraw.Brush(0))
+            agg.flush()
         else:
-             print(f"Error: Preferred layout index {layout_index_to_use} out of range.")
-             # Draw error
+            ImageDraw.Draw(sprite).polygon(trapezoid, fill=0)  # black (epd.GRAY4) runway
+        # Paste mask stays hard-edged regardless so the blit region is exact
+        ImageDraw.Draw(mask).polygon(trapezoid, fill=255)  # paste only the trapezoid
+        # Markings reuse the stamps above
+        sprite.paste(_CENTERLINE_STAMP, (cx - 1, base - half_len + 4), mask=_CENTERLINE_STAMP)
+        sprite.paste(_THRESHOLD_STAMP, (cx - 25, base + half_len - 5), mask=_THRESHOLD_STAMP)
+        # Runway number, same placement math as the old per-frame draw.text
+        runway_text = str(_RUNWAY_NUMBER).zfill(2)
+        rn_font = config.font36b
+        rn_w, rn_h = _rwy_size(runway_text, rn_font)
+        ImageDraw.Draw(sprite).text((cx - rn_w // 2, base + half_len - rn_h - 19),
+                                    runway_text, fill=255, font=rn_font)
+        _runway_sprite_cache["img"] = sprite
+        _runway_sprite_cache["mask"] = mask
+    return _runway_sprite_cache["img"], _runway_sprite_cache["mask"]
+
+# Parsed preferred_layouts cache - the setting is effectively constant, so
+# only re-split it into digits when the raw value actually changes.
+_pref_cache = {"raw": None, "lst": []}
+
+# Wind speed unit labels keyed by the wind_speed_units setting
+_WS_UNIT_LABEL = {1: "mph"} # everything else displays as knots
+
+# Hash of the last METAR/settings combination layout_wind rendered. When it
+# matches, the frame would be pixel-identical, so the layout returns False to
+# tell the main loop to skip the (expensive, panel-wearing) e-paper refresh.
+_last_render_hash = None
+
+def invalidate_render_cache():
+    # Force the next layout call to redraw even if the METAR is unchanged -
+    # the main loop uses this for its periodic anti-ghosting refresh
+    global _last_render_hash
+    _last_render_hash = None
+
+# Flattened dispatch table for cycle_layout - rebuilt only when the
+# preferred/cycle configuration changes, so steady-state dispatch is a single
+# next() instead of modulo arithmetic plus list indexing every call.
+_dispatch_iter = None
+_dispatch_key = None
 
-    else: # Cycle through all layouts
-         current_cycle_index = cycle_num % len(layout_list)
-         print(f'\033[91m--> cycle_num Layout Index: {current_cycle_index} <--\033[0m') # debug
-         cycle_pick = layout_list[current_cycle_index]
-         # Call with the new signature
-         cycle_pick(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units)
-         cycle_num = (cycle_num + 1) # Cycle through all
+# cycle_layout needs update to accept and pass epd, Limage, draw
+def cycle_layout(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units, layout_list, preferred_layouts, use_preferred):
+    global _dispatch_iter, _dispatch_key
+
+    key = (use_preferred, preferred_layouts, id(layout_list), len(layout_list))
+    if key != _dispatch_key:
+        if use_preferred == 1:
+            if _pref_cache["raw"] != preferred_layouts:
+                _pref_cache["raw"] = preferred_layouts
+                _pref_cache["lst"] = [int(a) for a in str(preferred_layouts)]
+            p_layouts_lst = _pref_cache["lst"]
+            # print('p_layouts_lst:',p_layouts_lst) # debug
+            for i in p_layouts_lst:
+                if not 0 <= i < len(layout_list):
+                    log.error("Preferred layout index %d out of range.", i)
+            picks = [layout_list[i] for i in p_layouts_lst if 0 <= i < len(layout_list)]
+            if not picks:
+                log.error("Preferred layout list is empty or invalid.")
+                # Optionally draw error message on Limage
+                _dispatch_iter = None
+                _dispatch_key = key
+                return
+            _dispatch_iter = itertools.cycle(picks)
+        else: # Cycle through all layouts
+            _dispatch_iter = itertools.cycle(layout_list)
+        _dispatch_key = key
+
+    if _dispatch_iter is None:
+        log.error("Preferred layout list is empty or invalid.")
+        return
+
+    cycle_pick = next(_dispatch_iter)
+    log.debug('--> Cycle Layout: %s <--', cycle_pick.__name__)
+    # Call with the new signature
+    return cycle_pick(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units)
 
 
 # random_layout needs update to accept and pass epd, Limage, draw
 def random_layout(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units, layout_list):
     if not layout_list:
-         print("Error: Layout list is empty.")
+         log.error("Layout list is empty.")
          return
     rand_pick = random.choice(layout_list)
-    # print('\033[91m--> Random Layout:',str(rand_pick)[10:18],'<--\033[0m') # debug
-    print(f'\033[91m--> Random Layout: {rand_pick.__name__} <--\033[0m')
+    log.debug('--> Random Layout: %s <--', rand_pick.__name__)
     # Call with the new signature
-    rand_pick(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units)
+    return rand_pick(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units)
 
 ##################
 #  Layout: Wind  #
@@ -94,40 +289,50 @@ def layout_wind(epd, Limage, draw, metar, remarks, print_table, use_remarks, use
     Wind visualization layout - Adapted for 4-grayscale epd4in2 using direct PIL drawing.
     Includes runway markings, adjusted colors, larger runway number, tighter spacing,
     and pseudo-3D arrow.
+    Returns False when the METAR is unchanged and the redraw was skipped,
+    so the main loop can skip the e-paper refresh as well.
     """
+    global _last_render_hash
     # --- Font access via 'config' module ---
+    # Bind the fonts to locals once up front; config.fontXX is a module
+    # attribute lookup that would otherwise run a dozen-plus times per frame
+    f16 = config.font16; f16b = config.font16b; f24 = config.font24
+    f24b = config.font24b; f48b = config.font48b
 
     # --- Metar Data ---
     try:
         # ... (Keep the robust Metar data fetching/decoding) ...
         if not metar or not hasattr(metar, 'data') or not metar.data:
              print("Error: METAR object is empty or invalid in layout_wind.")
-             draw.text((10, 100), "Error: Invalid METAR data", fill=epd.GRAY4, font=config.font24)
+             draw.text((10, 100), "Error: Invalid METAR data", fill=epd.GRAY4, font=f24)
              return
         raw_metar_text = get_rawOb(metar)
         if not raw_metar_text or raw_metar_text == 'n/a':
             print(f"Warning: No raw METAR text available for decoding in layout_wind.")
             flightcategory, airport = "N/A", "N/A"; decoded_wndir, decoded_wnspd = "0", "0"
-            draw.text((10,100), "No METAR text", fill=epd.GRAY4, font=config.font24)
+            draw.text((10,100), "No METAR text", fill=epd.GRAY4, font=f24)
             descript = "N/A"; cctype_lst, ccheight_lst, dis_unit = [], [], ""; vis, vis_unit = "N/A", ""; tempf, temp_unit = "N/A", ""
         else:
-            decoded_airport, decoded_time, decoded_wndir, decoded_wnspd, decoded_wngust, decoded_vis, \
-                decoded_alt, decoded_temp, decoded_dew, decoded_cloudlayers, decoded_weather, decoded_rvr \
-                = decode_rawmessage(raw_metar_text)
-            flightcategory, icon = flight_category(metar)
-            airport = decoded_airport if decoded_airport else "N/A"
-            descript = get_wxstring(metar)
-            cctype_lst, ccheight_lst, dis_unit = get_clouds(metar, cloud_layer_units)
-            vis, vis_unit = get_visib(metar, visibility_units)
-            tempf, temp_unit = get_temp(metar, temperature_units)
+            # Same observation + same settings means a pixel-identical frame;
+            # bail out and let the caller skip the panel refresh entirely
+            render_hash = hash((raw_metar_text, "wind", wind_speed_units, cloud_layer_units,
+                                visibility_units, temperature_units))
+            if render_hash == _last_render_hash:
+                log.debug("layout_wind: METAR unchanged, skipping redraw")
+                return False
+            _last_render_hash = render_hash
+            # Decoded fields are cached across cycles - see _get_decoded above
+            flightcategory, airport, decoded_wndir, decoded_wnspd, descript, \
+                cctype_lst, ccheight_lst, dis_unit, vis, vis_unit, tempf, temp_unit \
+                = _get_decoded(metar, raw_metar_text, cloud_layer_units, visibility_units, temperature_units)
     except Exception as e:
         print(f"Error decoding METAR or getting data in layout_wind: {e}")
         flightcategory, airport = "N/A", "Error"; decoded_wndir, decoded_wnspd = "0", "0"
         descript = "Error"; cctype_lst, ccheight_lst, dis_unit = [], [], ""; vis, vis_unit = "N/A", ""; tempf, temp_unit = "N/A", ""
-        draw.text((10, 100), "Error: Decode Fail", fill=epd.GRAY4, font=config.font24)
+        draw.text((10, 100), "Error: Decode Fail", fill=epd.GRAY4, font=f24)
 
     # --- Constants ---
-    runway_number = 18
+    runway_number = _RUNWAY_NUMBER # also baked into the runway sprite
     HEADER_HEIGHT = 65
     WIND_INFO_Y = 85
     VISUALIZATION_Y = 170 # Base Y for visualization area
@@ -143,13 +348,12 @@ def layout_wind(epd, Limage, draw, metar, remarks, print_table, use_remarks, use
     # Header
     draw.rectangle((0, 0, SCREEN_WIDTH, HEADER_HEIGHT), fill=black)
     airport_text = airport[:10]
-    draw.text((LEFT_MARGIN, 10), airport_text, fill=white, font=config.font48b)
+    draw.text((LEFT_MARGIN, 10), airport_text, fill=white, font=f48b)
     fc_x = SCREEN_WIDTH - 75; fc_y = 15
     # Use font24b for flight category
-    fc_font = config.font24b
+    fc_font = f24b
     if flightcategory and flightcategory != "N/A":
-         try: fc_bbox = draw.textbbox((0,0), flightcategory, font=fc_font); fc_w = fc_bbox[2] - fc_bbox[0]; fc_h = fc_bbox[3] - fc_bbox[1]
-         except AttributeError: fc_w, fc_h = draw.textsize(flightcategory, font=fc_font)
+         fc_w, fc_h = _fc_size(flightcategory, fc_font)
          if flightcategory == "VFR" or flightcategory == "MVFR": draw.text((fc_x, fc_y), flightcategory, fill=white, font=fc_font)
          else: box_margin = 5; draw.rectangle((fc_x - box_margin, fc_y - box_margin, fc_x + fc_w + box_margin, fc_y + fc_h + box_margin), fill=white); draw.text((fc_x, fc_y), flightcategory, fill=black, font=fc_font)
     else: draw.text((fc_x, fc_y), "N/A", fill=white, font=fc_font)
@@ -159,11 +363,10 @@ def layout_wind(epd, Limage, draw, metar, remarks, print_table, use_remarks, use
     except: wind_direction = 0
     try: wind_speed = float(decoded_wnspd) if decoded_wnspd and decoded_wnspd != "Calm" else 0
     except: wind_speed = 0
-    ws_unit_label = "kts"
-    if wind_speed_units == 1: ws_unit_label = "mph"
-    elif wind_speed_units == 2: ws_unit_label = "kts"
-    wind_text = f"Wind: {str(wind_direction).zfill(3)}° at {int(round(wind_speed))} {ws_unit_label}"
-    draw.text((LEFT_MARGIN, WIND_INFO_Y), wind_text, fill=black, font=config.font24b)
+    ws_unit_label = _WS_UNIT_LABEL.get(wind_speed_units, "kts")
+    # Format-spec padding happens in C - no str()/zfill intermediates
+    wind_text = f"Wind: {wind_direction:03d}° at {round(wind_speed):.0f} {ws_unit_label}"
+    draw.text((LEFT_MARGIN, WIND_INFO_Y), wind_text, fill=black, font=f24b)
 
     # --- Left Column ---
     left_x = LEFT_MARGIN
@@ -171,46 +374,49 @@ def layout_wind(epd, Limage, draw, metar, remarks, print_table, use_remarks, use
     spacing = 55 # <<<< CHANGE: Reduced spacing
 
     # Weather
-    draw.text((left_x, y_pos), "Weather:", fill=black, font=config.font16b)
+    draw.text((left_x, y_pos), "Weather:", fill=black, font=f16b)
     max_wx_len = 25
-    draw.text((left_x + 5, y_pos + 20), descript[:max_wx_len], fill=black, font=config.font16)
+    draw.text((left_x + 5, y_pos + 20), descript[:max_wx_len], fill=black, font=f16)
     if len(descript) > max_wx_len:
-         draw.text((left_x + 5, y_pos + 40), descript[max_wx_len:max_wx_len*2], fill=black, font=config.font16)
+         draw.text((left_x + 5, y_pos + 40), descript[max_wx_len:max_wx_len*2], fill=black, font=f16)
     y_pos += spacing # <<<< CHANGE: Use reduced spacing
 
     # Cloud Cover
-    draw.text((left_x, y_pos), "Clouds:", fill=black, font=config.font16b)
+    draw.text((left_x, y_pos), "Clouds:", fill=black, font=f16b)
     if cctype_lst:
          for i in range(min(2, len(cctype_lst))):
              cctype = cctype_lst[i]
              ccheight = ccheight_lst[i]
-             height_str = str(ccheight) if str(ccheight).isdigit() else "N/A"
-             draw.text((left_x + 5, y_pos + 20 + i * 20), f"{cctype} {height_str}{dis_unit}", fill=black, font=config.font16)
+             # get_clouds hands back heights as already-formatted strings, so
+             # branch on the type directly instead of str()-ing twice per layer
+             if isinstance(ccheight, (int, float)):
+                 height_str = f"{ccheight:.0f}"
+             else:
+                 height_str = ccheight if ccheight.isdigit() else "N/A"
+             draw.text((left_x + 5, y_pos + 20 + i * 20), f"{cctype} {height_str}{dis_unit}", fill=black, font=f16)
     else:
-         draw.text((left_x + 5, y_pos + 20), "Clear", fill=black, font=config.font16)
+         draw.text((left_x + 5, y_pos + 20), "Clear", fill=black, font=f16)
     y_pos += spacing # <<<< CHANGE: Use reduced spacing
 
     # Visibility
-    draw.text((left_x, y_pos), "Visibility:", fill=black, font=config.font16b)
-    draw.text((left_x + 5, y_pos + 20), f"{vis}{vis_unit}", fill=black, font=config.font16)
+    draw.text((left_x, y_pos), "Visibility:", fill=black, font=f16b)
+    draw.text((left_x + 5, y_pos + 20), f"{vis}{vis_unit}", fill=black, font=f16)
     # No y_pos change needed after last item
 
     # --- Right Column ---
     right_x = SCREEN_WIDTH - 100
     y_pos = 125 # Reset Y
     # Temperature
-    draw.text((right_x, y_pos), "Temp:", fill=black, font=config.font16b)
-    draw.text((right_x + 5, y_pos + 20), f"{tempf}{temp_unit}", fill=black, font=config.font16)
+    draw.text((right_x, y_pos), "Temp:", fill=black, font=f16b)
+    draw.text((right_x + 5, y_pos + 20), f"{tempf}{temp_unit}", fill=black, font=f16)
 
     # --- Center Visualization ---
     centerX = SCREEN_WIDTH // 2
     centerY = VISUALIZATION_Y # Base Y stays same, offsets will change
 
-    # Define runway geometry BEFORE arrow calculation needs it
-    runway_base_y = centerY + 35
-    runway_width_near = 85 # Using the widened value from last step
-    runway_width_far = 50
-    runway_length = 60
+    # Runway geometry lives in the module constants shared with the sprite
+    # builder (the old duplicate local assignments also disagreed on the
+    # runway length, 60 vs 55 - the drawn value of 55 wins)
 
     # Draw Wind Arrow (if wind speed > 0)
     if wind_speed > 0:
@@ -219,8 +425,7 @@ def layout_wind(epd, Limage, draw, metar, remarks, print_table, use_remarks, use
         while relative_angle_deg > 180: relative_angle_deg -= 360
         while relative_angle_deg <= -180: relative_angle_deg += 360
 
-        angle_rad = math.radians(relative_angle_deg)
-        cos_a = math.cos(angle_rad); sin_a = math.sin(angle_rad)
+        sin_a, cos_a = _SINCOS[int(relative_angle_deg) + 180]
 
         # --- Arrow Perspective Calculation ---
         # Base arrow parameters
@@ -232,8 +437,8 @@ def layout_wind(epd, Limage, draw, metar, remarks, print_table, use_remarks, use
         arrow_shaft_width_near = 14 # Let's make it slightly wider for visibility
 
         # Calculate the runway's taper ratio
-        if runway_width_near != 0: # Avoid division by zero
-             runway_taper_ratio = runway_width_far / runway_width_near
+        if _RUNWAY_WIDTH_NEAR != 0: # Avoid division by zero
+             runway_taper_ratio = _RUNWAY_WIDTH_FAR / _RUNWAY_WIDTH_NEAR
         else:
              runway_taper_ratio = 1 # Default to no taper if runway width is zero
 
@@ -256,76 +461,37 @@ def layout_wind(epd, Limage, draw, metar, remarks, print_table, use_remarks, use
         # Recalculate points relative to arrow center using NEW far/near widths
         shaft_half_l = shaft_len / 2
 
-        # Define corners relative to the arrow's own center *before* rotation
-        p1 = (-far_half_w, -shaft_half_l)  # Tail left (uses calculated far width)
-        p2 = ( far_half_w, -shaft_half_l)  # Tail right (uses calculated far width)
-        p3 = ( near_half_w, shaft_half_l)  # Head base right (uses defined near width)
-        p4 = (-near_half_w, shaft_half_l)  # Head base left (uses defined near width)
-
-        # Rotate function
-        def rotate(x, y):
-            new_x = x * cos_a - y * sin_a; new_y = x * sin_a + y * cos_a
-            return int(arrow_center_x + new_x), int(arrow_center_y + new_y)
-
-        # Rotate shaft points
-        rp1=rotate(p1[0],p1[1]); rp2=rotate(p2[0],p2[1]); rp3=rotate(p3[0],p3[1]); rp4=rotate(p4[0],p4[1])
-        # Draw trapezoid shaft (dark gray)
-        draw.polygon([rp1,rp2,rp3,rp4], fill=dark_gray)
-
-        # Head points relative to arrow's center before rotation
+        # Head geometry relative to arrow's center before rotation
         head_base_y = shaft_half_l
         head_tip_y = head_base_y + arrow_head_length
         head_half_w = arrow_head_width / 2 # Head width not tapered for now
-        hp1 = (0, head_tip_y)             # Tip
-        hp2 = (-head_half_w, head_base_y) # Base corner 1
-        hp3 = ( head_half_w, head_base_y) # Base corner 2
 
-        # Rotate head points
-        rhp1=rotate(hp1[0],hp1[1]); rhp2=rotate(hp2[0],hp2[1]); rhp3=rotate(hp3[0],hp3[1])
-        # Draw triangle head (dark gray)
-        draw.polygon([rhp1, rhp2, rhp3], fill=dark_gray)
+        # All seven arrow points (shaft trapezoid + head triangle) come from
+        # the compiled geometry kernel - see metar_geom.arrow_points.
+        # Rasterize shaft + head into one small scratch mask tile and
+        # composite with a single paste instead of two polygon draws on the
+        # full-size buffer. Tile half-size 35 px > max arrow radius (~27 px).
+        tile_half = 35
+        rot = arrow_points(cos_a, sin_a, near_half_w, far_half_w, shaft_half_l,
+                           head_half_w, head_base_y, head_tip_y, tile_half, tile_half).tolist()
+        arrow_tile = Image.new("L", (2 * tile_half, 2 * tile_half), 0)
+        tile_draw = ImageDraw.Draw(arrow_tile)
+        tile_draw.polygon([tuple(p) for p in rot[:4]], fill=255) # trapezoid shaft
+        tile_draw.polygon([tuple(p) for p in rot[4:]], fill=255) # triangle head
+        Limage.paste(dark_gray, (arrow_center_x - tile_half, arrow_center_y - tile_half), mask=arrow_tile)
 
     # Draw Runway (position adjusted slightly if needed relative to arrow)
     runway_base_y = centerY + 35 # Shift runway down slightly more to accommodate arrow
-    runway_width_near = 85; runway_width_far = 50; runway_length = 55
-    rw_p1 = (centerX - runway_width_near // 2, runway_base_y + runway_length // 2)
-    rw_p2 = (centerX - runway_width_far // 2,  runway_base_y - runway_length // 2)
-    rw_p3 = (centerX + runway_width_far // 2,  runway_base_y - runway_length // 2)
-    rw_p4 = (centerX + runway_width_near // 2, runway_base_y + runway_length // 2)
-    draw.polygon([rw_p1, rw_p2, rw_p3, rw_p4], fill=black)
-    # Dashed centerline
-    dash_length = 6; gap_length = 4; y_start = runway_base_y - runway_length // 2 + gap_length; y_end = runway_base_y + runway_length // 2 - gap_length
-    current_y = y_start
-    while current_y < y_start + 16: #only do two dashes
-        draw.line((centerX, current_y, centerX, min(current_y + dash_length, y_end)), fill=white, width=2)
-        current_y += dash_length + gap_length
-
-    # CHANGE: Larger runway number font
-    runway_text = str(runway_number).zfill(2)
-    rn_font = config.font36b # Use the larger bold font
-    try: rn_bbox = draw.textbbox((0,0), runway_text, font=rn_font); rn_w = rn_bbox[2] - rn_bbox[0]; rn_h = rn_bbox[3] - rn_bbox[1]
-    except AttributeError: rn_w, rn_h = draw.textsize(runway_text, font=rn_font)
-
-
-# Calculate original position
-    rn_x_orig = centerX - rn_w // 2
-    rn_y_orig = runway_base_y + runway_length // 2 - rn_h - 6
-
-# Apply adjustments: +2 to x, -5 to y
-    rn_x_adjusted = rn_x_orig 
-    rn_y_adjusted = rn_y_orig - 13
-
-# Draw using adjusted coordinates
-    draw.text((rn_x_adjusted, rn_y_adjusted), runway_text, fill=white, font=rn_font)
-
-    # Runway threshold markings (kept from previous fix)
-    marker_y1 = runway_base_y + runway_length // 2 - 5
-    marker_y2 = runway_base_y + runway_length // 2
-    for x_offset in [-25, -18, -11, -4, 4, 11, 18, 25]:
-        draw.line((centerX + x_offset, marker_y1, centerX + x_offset, marker_y2), fill=white, width=1)
+    # Entire runway graphic (trapezoid, dashes, ticks, number) comes from the
+    # cached sprite - one masked paste instead of the old polygon/line/text ops
+    sprite, sprite_mask = _get_runway_sprite()
+    Limage.paste(sprite, (centerX - _RUNWAY_WIDTH_NEAR // 2 - 1,
+                          runway_base_y - _RUNWAY_LENGTH // 2 - 1), mask=sprite_mask)
 
     # --- Footer ---
-    update_text = last_update()
-    try: up_bbox = draw.textbbox((0,0), update_text, font=config.font16); up_w = up_bbox[2] - up_bbox[0]; up_h = up_bbox[3] - up_bbox[1]
-    except AttributeError: up_w, up_h = draw.textsize(update_text, font=config.font16)
-    draw.text((LEFT_MARGIN, SCREEN_HEIGHT - up_h - 5), update_text, fill=black, font=config.font16)
+    # Paste the cached timestamp bitmap; it is only re-rasterized when the
+    # minute changes (see _footer_image above)
+    footer_img, footer_ink_h = _footer_image(f16, black, white)
+    Limage.paste(footer_img, (LEFT_MARGIN, SCREEN_HEIGHT - footer_ink_h - 5))
+
+    return True # Frame was (re)drawn
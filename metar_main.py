@@ -58,14 +58,21 @@ from metar_routines import * # Ensures Metar class should be imported
 # Import PIL for direct drawing
 from PIL import Image, ImageDraw, ImageFont
 import time
+import threading
+from datetime import datetime
 import requests
 import json
 import sys
 import os
 import sys
 import logging # Added for consistency with Waveshare examples
+import functools
 import config
 import traceback # <--- ADDED IMPORT
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import metar_fastbuf
 
 # Setup logging
 logging.basicConfig(level=logging.INFO) # Use INFO or DEBUG
@@ -79,74 +86,79 @@ fontdir = os.path.join(basedir, 'fonts')
 regular_font_path = os.path.join(fontdir, 'noto', 'NotoSansMono-Regular.ttf')
 bold_font_path = os.path.join(fontdir, 'noto', 'NotoSansMono-Bold.ttf')
 
-try:
-    logging.info(f"Loading regular font: {regular_font_path}")
-    logging.info(f"Loading bold font: {bold_font_path}")
-
-    # Assign fonts directly to the imported config module
-    config.font16 = ImageFont.truetype(regular_font_path, 16)
-    config.font16b = ImageFont.truetype(bold_font_path, 16)
-    config.font24 = ImageFont.truetype(regular_font_path, 24)
-    config.font24b = ImageFont.truetype(bold_font_path, 24)
-    config.font36 = ImageFont.truetype(regular_font_path, 36)
-    config.font36b = ImageFont.truetype(bold_font_path, 36)
-    config.font48 = ImageFont.truetype(regular_font_path, 48)
-    config.font48b = ImageFont.truetype(bold_font_path, 48)
-    # Add others if needed...
-
-    logging.info("Fonts loaded successfully into config.")
-
-except Exception as e: # Catch generic Exception during font loading
-    logging.error(f"Font file not found or cannot be read: {e}")
-    logging.error(f"Regular: {regular_font_path}")
-    logging.error(f"Bold: {bold_font_path}")
-    logging.warning("Using default PIL font as fallback.")
-    # Assign default fonts to the config module
-    config.font16 = ImageFont.load_default()
-    config.font16b = ImageFont.load_default()
-    config.font24 = ImageFont.load_default()
-    config.font24b = ImageFont.load_default()
-    config.font36 = ImageFont.load_default()
-    config.font36b = ImageFont.load_default()
-    config.font48 = ImageFont.load_default()
-    config.font48b = ImageFont.load_default()
+# Fonts are loaded on demand rather than eagerly: each truetype call mmaps
+# the TTF and builds a glyph cache, and most runs only ever touch a couple
+# of sizes. config serves its fontNN/fontNNb attributes through this cached
+# loader, so the first layout to ask for a size pays for it and nobody pays
+# for the rest.
+def _load_font(size, bold=False):
+    path = bold_font_path if bold else regular_font_path
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception as e: # Catch generic Exception during font loading
+        logging.error(f"Font file not found or cannot be read: {path}: {e}")
+        logging.warning("Using default PIL font as fallback.")
+        return ImageFont.load_default()
+
+config.get_font = functools.lru_cache(maxsize=None)(_load_font)
 # ---------------------------------------------------------------------
 
+# Auto-update cadence per flight category, in seconds. Used when the user
+# interval is 0; unknown/N-A categories fall back to 30 minutes.
+SLEEP_BY_CAT = {"VFR": 3600, "MVFR": 1800, "IFR": 1200, "LIFR": 600}
+
+# SPI clock for the framebuffer transfer. The driver opens the bus at a
+# conservative 4 MHz; 16 MHz is safe on the short ribbon of a HAT-mounted
+# panel and cuts bytes-on-wire time to a quarter.
+SPI_SPEED_HZ = 16000000
+
+def set_spi_speed(hz=SPI_SPEED_HZ):
+    # module_init() reopens the SPI device at 4 MHz on every panel init,
+    # so this has to be reapplied after each Init_4Gray / init_Partial
+    try:
+        epd4in2.epdconfig.SPI.max_speed_hz = hz
+        logging.info(f"SPI clock set to {hz} Hz")
+    except Exception as e:
+        logging.warning(f"Could not raise SPI clock ({e}); using driver default.")
+
 # Layouts - add new layouts to this list as necessary
 # Ensure these layout functions are updated to accept (epd, Limage, draw, ...) signature
 layout_list = [layout_wind] # Add layout routine names here
 use_preferred = 0
 
 # --- Command Line Argument Processing ---
-# (Keep existing cmdline arg processing as is)
-print('len(sys.argv):',len(sys.argv)) # debug
-print('sys.argv:',sys.argv,'\n') # debug
+def parse_args(argv):
+    # One structured parse of the ten web-admin args, in order: airport,
+    # use_disp_format, interval, use_remarks, wind_speed_units,
+    # cloud_layer_units, visibility_units, temperature_units,
+    # pressure_units, preferred_layouts (string repr of a list, or 'na')
+    return (argv[1].upper(), *map(int, argv[2:10]), argv[10])
+
+logging.debug('sys.argv: %s', sys.argv)
 
 if len(sys.argv) >= 10:
     logging.info('Using Args passed from web admin')
-    airport = str(sys.argv[1].upper())
-    use_disp_format = int(sys.argv[2])
-    interval = int(sys.argv[3])
-    use_remarks = int(sys.argv[4])
-    wind_speed_units = int(sys.argv[5])
-    cloud_layer_units = int(sys.argv[6])
-    visibility_units = int(sys.argv[7])
-    temperature_units = int(sys.argv[8])
-    pressure_units = int(sys.argv[9])
-    preferred_layouts = (sys.argv[10]) # string representation of the the list. Needs to be converted back to list
-
-    print('\033[96mpreferred_layouts:',preferred_layouts,'\033[0m') # debug
-    if preferred_layouts == 'na':
-        use_preferred = 0
-    else:
-        use_preferred = 1
+    (airport, use_disp_format, interval, use_remarks, wind_speed_units,
+     cloud_layer_units, visibility_units, temperature_units,
+     pressure_units, preferred_layouts) = parse_args(sys.argv)
+
+    logging.debug('preferred_layouts: %s', preferred_layouts)
+    use_preferred = 0 if preferred_layouts == 'na' else 1
 else:
     logging.info('Using Args from settings.py file')
     # Assuming these are loaded from metar_settings import *
     # airport, use_disp_format, interval, etc.
 
-print("\nAirport\t", "Layout\t", "Update\t", "Remarks")
-print(str(airport)+"\t", str(use_disp_format)+"\t", str(interval)+"\t", str(use_remarks)+"\n")
+logging.info('Airport %s  Layout %s  Update %s  Remarks %s',
+             airport, use_disp_format, interval, use_remarks)
+
+# With a fixed layout selection (the common case - layout_list holds one
+# entry today) the dispatch in main() is decided once here, not re-checked
+# every cycle. Stays None for the cycle/random modes.
+if 0 <= use_disp_format < len(layout_list):
+    _BOUND_LAYOUT = layout_list[use_disp_format]
+else:
+    _BOUND_LAYOUT = None
 
 
 def main(epd, Limage, draw): # Accept epd, Limage, draw
@@ -154,24 +166,23 @@ def main(epd, Limage, draw): # Accept epd, Limage, draw
 
     # Choose which layout to use.
     # Pass epd, Limage, draw, and other params to the layout functions
-    if use_disp_format == -1:
+    if _BOUND_LAYOUT is not None:
+        # Layout fixed at startup - call it directly, no bounds checks
+        return _BOUND_LAYOUT(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units)
+
+    elif use_disp_format == -1:
         # random_layout needs update to accept (epd, Limage, draw, ...)
-        random_layout(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units, layout_list)
+        return random_layout(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units, layout_list)
 
     elif use_disp_format == -2:
         # cycle_layout needs update to accept (epd, Limage, draw, ...)
-        cycle_layout(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units, layout_list, preferred_layouts, use_preferred)
+        return cycle_layout(epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units, layout_list, preferred_layouts, use_preferred)
 
     else:
-        # Call the specific layout chosen by index
-        if 0 <= use_disp_format < len(layout_list):
-            print("Layout -->",use_disp_format,'<--') # debug
-            # Call the layout function with the new signature
-            layout_list[use_disp_format](epd, Limage, draw, metar, remarks, print_table, use_remarks, use_disp_format, interval, wind_speed_units, cloud_layer_units, visibility_units, temperature_units, pressure_units)
-        else:
-            logging.error(f"Invalid layout index selected: {use_disp_format}")
-            # Optionally draw an error message on Limage using 'draw'
-            draw.text((10, 100), f"Error: Invalid Layout {use_disp_format}", fill=epd.GRAY4, font=font24)
+        # Fixed index that didn't bind above - it's out of range
+        logging.error(f"Invalid layout index selected: {use_disp_format}")
+        # Optionally draw an error message on Limage using 'draw'
+        draw.text((10, 100), f"Error: Invalid Layout {use_disp_format}", fill=epd.GRAY4, font=config.font24)
 
     # Printing to e-Paper is now handled in the main loop after main() returns
 
@@ -185,112 +196,280 @@ if __name__ == "__main__":
         epd = epd4in2.EPD() # Instantiate instance for display.
         logging.info("Setting display to 4 Grayscale mode...")
         epd.Init_4Gray()    # Initialize for 4 grayscale mode ONCE.
+        set_spi_speed()
         logging.info("Clearing display...")
         epd.Clear()         # Clear screen once initially.
         time.sleep(1)       # Allow time for clearing
 
+        # Pay the Numba compile/cache-load cost now, not on the first refresh
+        metar_fastbuf.warm_up(epd.width, epd.height)
+
+        # The panel flush (display_4Gray) blocks for seconds of SPI traffic
+        # and waveform time while the CPU sits idle. Push it onto a single
+        # background worker so the sleep and the next cycle's fetch/render
+        # overlap with it; gray_buffer is independent of Limage, so the next
+        # frame can be drawn while the previous one is still flushing.
+        display_pool = ThreadPoolExecutor(max_workers=1)
+        display_future = None
+
+        # Likewise overlap the FAA fetch with the sleep/flush: a worker is
+        # handed the next fetch before we sleep, waits out most of the
+        # interval itself, and has the METAR in memory by wake-up time.
+        fetch_pool = ThreadPoolExecutor(max_workers=1)
+        fetch_future = None
+        fetch_stop = threading.Event() # set on shutdown to unblock the worker
+        FETCH_LEAD_S = 30 # start the fetch this long before wake-up
+
+        def _delayed_fetch(airport, delay):
+            # Event.wait instead of time.sleep so Ctrl+C shutdown doesn't
+            # hang on a worker sleeping out a long interval
+            if fetch_stop.wait(delay):
+                return None
+            return Metar(airport)
+
+        # --- Create Image Buffer and Drawing Context ---
+        # Allocated once and reused every cycle: clearing with a filled
+        # rectangle is just a memset on already-warm memory, where a fresh
+        # Image.new each loop would malloc + fault in 120k bytes again.
+        # Bind the panel constants once; they never change after init and
+        # the loop body references them every cycle
+        W, H = epd.width, epd.height
+        G1, G3, G4 = epd.GRAY1, epd.GRAY3, epd.GRAY4
+
+        logging.info("Creating Image buffer (Mode L)")
+        Limage = Image.new('L', (W, H), G1) # White background
+        draw = ImageDraw.Draw(Limage) # Get drawing context
+        ErrorImage = None # Error-path image, allocated on first use
+        draw_error = None
+        err_msg_widths = None # measured once, the strings never change
+
+        # Last framebuffer hash, for skipping refreshes of identical frames.
+        # Force a real refresh every few cycles anyway so the panel gets a
+        # full waveform pass and doesn't accumulate ghosting.
+        last_frame_hash = None
+        cycles_since_refresh = 0
+        FORCE_REFRESH_CYCLES = 6
+
+        # Previous frame pixels and current panel mode, for the fast
+        # partial-refresh path. The partial LUT is 1-bit, so it's only used
+        # when the changed region is small and pure black/white; anything
+        # else goes through the full 4-gray waveform.
+        prev_frame = None
+        panel_mode = '4gray' # Init_4Gray() was just called
+        PARTIAL_MAX_AREA = (epd.width * epd.height) // 8
+
+        # Carried across cycles so a 304 cache hit can reuse them
+        flightcategory = "N/A"
+
         while True:
             try:
-                # --- Create Image Buffer and Drawing Context ---
-                logging.info("Creating new Image buffer (Mode L)")
-                # Create image with white background (GRAY1)
-                Limage = Image.new('L', (epd.width, epd.height), epd.GRAY1)
-                draw = ImageDraw.Draw(Limage) # Get drawing context
+                # Timestamp the cycle start so the sleep below can subtract
+                # however long the fetch/render/flush took, keeping the
+                # refresh cadence from drifting
+                cycle_start = time.monotonic()
+
+                # Clear the reused buffer back to white (GRAY1)
+                draw.rectangle([(0, 0), (W, H)], fill=G1)
 
                 # --- Get METAR Data ---
-                current_time = time.strftime("%m/%d/%Y %H:%M", time.localtime())
+                current_time = datetime.now().strftime("%m/%d/%Y %H:%M")
                 logging.info(f"Fetching METAR for {airport} at {current_time}")
 
-                metar = Metar(airport) # Fetch data using Metar class
+                if fetch_future is not None:
+                    # Prefetched during the sleep; clear the slot first so a
+                    # worker exception doesn't leave a stale future behind
+                    fut, fetch_future = fetch_future, None
+                    metar = fut.result()
+                else:
+                    metar = Metar(airport) # First cycle (or after an error): fetch inline
                 raw_metar_text = get_rawOb(metar) # Get raw text
 
                 if raw_metar_text and len(raw_metar_text) > 0:
                     logging.info(f'Raw METAR: {raw_metar_text}')
-                    remarks, print_table = decode_remarks(raw_metar_text)
-                    flightcategory, icon = flight_category(metar) # Assumes metar object is populated correctly
+                    if metar.cached:
+                        # FAA answered 304 - same observation as last cycle,
+                        # so the previous decode still holds
+                        logging.info("METAR unchanged (304) - reusing decoded remarks.")
+                    else:
+                        remarks, print_table = decode_remarks(raw_metar_text)
+                        flightcategory, icon = flight_category(metar) # Assumes metar object is populated correctly
                     logging.info(f"Flight Category: {flightcategory}")
                 else:
                     logging.warning("No METAR Being Reported or fetch failed.")
                     # Draw message directly onto Limage
-                    draw.text((20, 100), f"No METAR Data for {airport}", fill=epd.GRAY4, font=font24)
+                    draw.text((20, 100), f"No METAR Data for {airport}", fill=G4, font=config.font24)
                     remarks, print_table = "", [] # Set defaults
                     flightcategory = "N/A" # Set default category
 
                 # --- Build Display Layout ---
                 logging.info("Building display layout...")
-                main(epd, Limage, draw) # Call main function to draw on Limage
-
-                # --- Update E-Paper Screen ---
-                logging.info("Generating 4Gray Buffer...")
-                gray_buffer = epd.getbuffer_4Gray(Limage)
-
-                logging.info("Sending 4Gray Buffer to display...")
-                epd.display_4Gray(gray_buffer)
-                logging.info("Display update complete.")
+                if cycles_since_refresh >= FORCE_REFRESH_CYCLES:
+                    # Anti-ghosting: the layout must not skip this cycle, or
+                    # a stable METAR would keep the panel from ever getting
+                    # a full waveform pass
+                    invalidate_render_cache()
+                updated = main(epd, Limage, draw) # Call main function to draw on Limage
+
+                if updated is False:
+                    # Layout saw an unchanged METAR and skipped the redraw;
+                    # don't push an identical frame to the panel
+                    cycles_since_refresh += 1
+                    logging.info("METAR unchanged - skipping e-Paper refresh.")
+                else:
+                    # --- Update E-Paper Screen ---
+                    # One ndarray view of the rendered frame (zero-copy for
+                    # mode 'L') feeds both the diff detector and the packer;
+                    # nothing below touches pixels through PIL again.
+                    new_frame = np.asarray(Limage, dtype=np.uint8)
+                    # See whether the frame delta qualifies for the fast
+                    # 1-bit partial refresh: a small dirty rectangle with no
+                    # mid-gray pixels on either side of the change.
+                    partial_box = None
+                    if prev_frame is not None and cycles_since_refresh < FORCE_REFRESH_CYCLES:
+                        ys, xs = np.nonzero(new_frame != prev_frame)
+                        if ys.size:
+                            y0, y1 = int(ys.min()), int(ys.max()) + 1
+                            # Align the x edges to whole bytes (8 px): the
+                            # driver rounds an unaligned start column *up*,
+                            # which would drop changed pixels on the left
+                            # edge, and it always writes full bytes on the
+                            # right - so check and send the widened box
+                            x0 = int(xs.min()) & ~7
+                            x1 = min((int(xs.max()) + 8) & ~7, W)
+                            if ((y1 - y0) * (x1 - x0) <= PARTIAL_MAX_AREA
+                                    and np.isin(prev_frame[y0:y1, x0:x1], (0x00, 0xFF)).all()
+                                    and np.isin(new_frame[y0:y1, x0:x1], (0x00, 0xFF)).all()):
+                                partial_box = (x0, y0, x1, y1)
+
+                    if partial_box is not None:
+                        x0, y0, x1, y1 = partial_box
+                        logging.info(f"Partial refresh of {x1 - x0}x{y1 - y0} region at ({x0},{y0})...")
+                        if display_future is not None:
+                            display_future.result() # previous flush must finish first
+                            display_future = None
+                        if panel_mode != 'partial':
+                            epd.init_Partial()
+                            set_spi_speed()
+                            panel_mode = 'partial'
+                            # Seed the panel's old-data plane with the frame
+                            # currently on screen (driver convention: 0=white)
+                            epd.DATA = np.packbits(prev_frame <= 0x80, axis=1).ravel()
+                        epd.EPD_4IN2_PartialDisplay(x0, y0, x1, y1,
+                                                    np.packbits(new_frame > 0x80, axis=1).ravel())
+                        cycles_since_refresh += 1
+                        last_frame_hash = None # panel no longer matches the last full frame
+                    else:
+                        logging.info("Generating 4Gray Buffer...")
+                        gray_buffer = metar_fastbuf.pack_4gray(new_frame)
+
+                        # The display transaction (~seconds of SPI + waveform
+                        # time) is the dominant cost; skip it when the packed
+                        # frame is byte-identical to what's on the panel.
+                        frame_hash = hashlib.blake2b(gray_buffer, digest_size=8).digest()
+                        if frame_hash == last_frame_hash and cycles_since_refresh < FORCE_REFRESH_CYCLES:
+                            cycles_since_refresh += 1
+                            logging.info("Frame unchanged - skipping panel update.")
+                        else:
+                            logging.info("Sending 4Gray Buffer to display...")
+                            if display_future is not None:
+                                display_future.result() # previous flush must finish first
+                            if panel_mode != '4gray':
+                                epd.Init_4Gray() # leave partial mode
+                                set_spi_speed()
+                                panel_mode = '4gray'
+                            display_future = display_pool.submit(epd.display_4Gray, gray_buffer)
+                            last_frame_hash = frame_hash
+                            cycles_since_refresh = 0
+                            logging.info("Display update started in background.")
+
+                    prev_frame = new_frame.copy()
 
                 # --- Calculate Sleep Interval ---
-                sleep_interval = 0
                 if interval != 0: # Manual interval set
                     sleep_interval = interval
                     logging.info(f"Manual sleep interval: {sleep_interval} seconds")
                 else: # Auto interval based on flight category
-                    if flightcategory == "VFR":
-                        sleep_interval = 3600 # 1 hour
-                        logging.info("Auto Interval VFR - Sleep 1 hour")
-                    elif flightcategory == "MVFR":
-                        sleep_interval = 1800 # 30 mins
-                        logging.info("Auto Interval MVFR - Sleep 30 mins")
-                    elif flightcategory == "IFR":
-                        sleep_interval = 1200 # 20 mins
-                        logging.info("Auto Interval IFR - Sleep 20 mins")
-                    elif flightcategory == "LIFR":
-                        sleep_interval = 600 # 10 mins
-                        logging.info("Auto Interval LIFR - Sleep 10 mins")
-                    else: # N/A or other case
-                        sleep_interval = 1800 # Default to 30 mins if category unknown
-                        logging.info("Auto Interval Unknown/N/A - Sleep 30 mins")
-
-                logging.info(f"Sleeping for {sleep_interval} seconds...")
-                time.sleep(sleep_interval)
+                    sleep_interval = SLEEP_BY_CAT.get(flightcategory, 1800)
+                    logging.info(f"Auto interval {flightcategory} -> {sleep_interval}s")
+
+                # Sleep only the remainder of the interval; fetch+render+
+                # flush time already elapsed since cycle_start
+                remaining = max(0, (cycle_start + sleep_interval) - time.monotonic())
+
+                # Queue the next fetch so it lands shortly before wake-up -
+                # late enough to respect the FAA cadence, early enough that
+                # the network RTT is off the critical path
+                fetch_future = fetch_pool.submit(_delayed_fetch, airport,
+                                                 max(0, remaining - FETCH_LEAD_S))
+
+                logging.info(f"Sleeping for {remaining:.0f} seconds...")
+                time.sleep(remaining)
                 # Do NOT put epd.sleep() here if looping
 
             except Exception as e:
-                logging.error("Error Occurred in Main Loop Execution")
-                exception_type, exception_object, exception_traceback = sys.exc_info()
-                filename = os.path.basename(exception_traceback.tb_frame.f_code.co_filename)
-                line_number = exception_traceback.tb_lineno
-                logging.error(f"Error: {e}")
-                logging.error(f"Exception type: {exception_type}")
-                logging.error(f"File name: {filename}")
-                logging.error(f"Line number: {line_number}")
-                print(traceback.format_exc()) # Print full traceback for debugging
+                # One log record with the traceback attached, instead of
+                # five separate error lines plus a printed traceback
+                logging.exception("Error Occurred in Main Loop Execution")
+                tb = traceback.extract_tb(e.__traceback__)[-1]
+                filename = os.path.basename(tb.filename)
+                line_number = tb.lineno
 
                 # --- Display Error on E-Paper ---
                 try:
                     logging.info("Attempting to display error message on e-Paper...")
-                    # Create a fresh image for the error message
-                    ErrorImage = Image.new('L', (epd.width, epd.height), epd.GRAY1) # White background
-                    draw_error = ImageDraw.Draw(ErrorImage)
-
-                    # Simple Error Message
+                    # Drain any in-flight background flush before talking to
+                    # the panel from this thread
+                    if display_future is not None:
+                        try:
+                            display_future.result()
+                        except Exception:
+                            pass # already being handled - we're on the error path
+                        display_future = None
+                    # Reuse the error image across error cycles too
+                    if ErrorImage is None:
+                        ErrorImage = Image.new('L', (W, H), G1) # White background
+                        draw_error = ImageDraw.Draw(ErrorImage)
+                    else:
+                        draw_error.rectangle([(0, 0), (W, H)], fill=G1)
+
+                    # Simple Error Message. Both strings are constant, so
+                    # measure them once (getbbox uses FreeType advance
+                    # widths - no rasterize pass like the old textsize) and
+                    # reuse the widths on later errors.
                     msg1 = "- Error Occurred -"
                     msg2 = "Check Logs. Retrying in 60s..."
-                    w1, h1 = draw_error.textsize(msg1, font=font36b)
-                    draw_error.text(((epd.width - w1) / 2, 80), msg1, fill=epd.GRAY4, font=font36b)
-                    w2, h2 = draw_error.textsize(msg2, font=font24)
-                    draw_error.text(((epd.width - w2) / 2, 130), msg2, fill=epd.GRAY4, font=font24)
+                    f36b, f24, f16 = config.font36b, config.font24, config.font16
+                    if err_msg_widths is None:
+                        bbox1 = f36b.getbbox(msg1)
+                        bbox2 = f24.getbbox(msg2)
+                        err_msg_widths = (bbox1[2] - bbox1[0], bbox2[2] - bbox2[0])
+                    w1, w2 = err_msg_widths
+                    draw_error.text(((W - w1) / 2, 80), msg1, fill=G4, font=f36b)
+                    draw_error.text(((W - w2) / 2, 130), msg2, fill=G4, font=f24)
 
                     # Detailed Info (optional, might be too much)
-                    err_line1 = f"Type: {exception_type.__name__}"
+                    err_line1 = f"Type: {type(e).__name__}"
                     err_line2 = f"File: {filename} Line: {line_number}"
-                    draw_error.text((20, 180), err_line1, fill=epd.GRAY3, font=font16)
-                    draw_error.text((20, 200), err_line2, fill=epd.GRAY3, font=font16)
-                    draw_error.text((20, 220), str(e)[:40], fill=epd.GRAY3, font=font16) # First part of error message
-
-                    error_buffer = epd.getbuffer_4Gray(ErrorImage)
+                    draw_error.text((20, 180), err_line1, fill=G3, font=f16)
+                    draw_error.text((20, 200), err_line2, fill=G3, font=f16)
+                    draw_error.text((20, 220), str(e)[:40], fill=G3, font=f16) # First part of error message
+
+                    if panel_mode != '4gray':
+                        epd.Init_4Gray() # leave partial mode before a 4-gray write
+                        set_spi_speed()
+                        panel_mode = '4gray'
+                    error_buffer = metar_fastbuf.pack_4gray(ErrorImage)
                     epd.display_4Gray(error_buffer)
                     logging.info("Error message displayed.")
 
+                    # The glass now shows the error screen, not the last
+                    # rendered frame - drop the skip-state so the first
+                    # successful cycle repaints unconditionally
+                    invalidate_render_cache()
+                    last_frame_hash = None
+                    cycles_since_refresh = 0
+                    prev_frame = None # the error screen is on the glass now, not this frame
+
                 except Exception as display_err:
                     logging.error(f"Could NOT display error message on e-Paper: {display_err}")
 
@@ -302,6 +481,13 @@ if __name__ == "__main__":
         print(traceback.format_exc())
     except KeyboardInterrupt:
         logging.info("Ctrl+C detected. Exiting...")
+        try:
+            fetch_stop.set() # wake any prefetch worker still waiting
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
+            if display_future is not None:
+                display_future.result() # let an in-flight refresh finish
+        except Exception:
+            pass
         epd.sleep() # Put display to sleep
         time.sleep(1)
         epd4in2.epdconfig.module_exit(cleanup=True) # Clean up GPIO
@@ -12,6 +12,7 @@ import urllib.request, urllib.error, urllib.parse
 import xml.etree.ElementTree as ET
 import socket
 import requests
+from requests.adapters import HTTPAdapter
 
 # Misc Variables
 decode = []      # used to decode the raw metar
@@ -39,24 +40,51 @@ class_c = ['KBHM', 'KHSV', 'KMOB', 'PANC', 'KDMA', 'KTUS', 'KLIT', 'KXNA', 'KBAB
            'KORF', 'KRIC', 'KROA', 'KGEG', 'KNUW', 'KSKA', 'KCRW', 'KGRB', 'KMKE', 'KMSN', \
            'TJSJ', 'TIST']
 
+# One keep-alive session for all METAR fetches. FAA only publishes a new
+# observation about once an hour, so each fetch sends the validators the
+# server gave us last time (ETag/Last-Modified); a 304 reply means "nothing
+# new" and costs one small round trip instead of a full download + parse.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+_metar_cache = {} # per-airport: {'etag', 'last_modified', 'data'}
+
+def fetch_metar_json(airport):
+    # Returns (data, cached): the parsed json list for the airport and
+    # whether it came back as a 304 from our cached copy.
+    url = "https://aviationweather.gov/api/data/metar?ids="+airport+"&format=json&hours=2.5"
+    cached = _metar_cache.get(airport)
+    headers = {}
+    if cached is not None:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    response = SESSION.get(url, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        return (cached['data'], True)
+
+    data = response.json()
+    _metar_cache[airport] = {'etag': response.headers.get('ETag'),
+                             'last_modified': response.headers.get('Last-Modified'),
+                             'data': data}
+    return (data, False)
+
+
 class Metar:
     def __init__(self, airport):
-        self.data = requests.get(
-            f"https://aviationweather.gov/api/data/metar?ids="+airport+"&format=json&hours=2.5").json()
-        self.data2 = requests.get(
-            f"https://aviationweather.gov/api/data/metar?ids="+airport+"&format=json&hours=2.5").json()
-        requests.session().close()
-        pass
+        # data and data2 were always two identical downloads; serve both
+        # attributes from a single (conditional) fetch.
+        self.data, self.cached = fetch_metar_json(airport)
+        self.data2 = self.data
 
     def update(self, airport):
-        self.data = requests.get(
-            f"https://aviationweather.gov/api/data/metar?ids="+airport+"&format=json&hours=2.5").json()
-        self.data2 = requests.get(
-            f"https://aviationweather.gov/api/data/metar?ids="+airport+"&format=json&hours=2.5").json()
-        requests.session().close()
+        self.data, self.cached = fetch_metar_json(airport)
+        self.data2 = self.data
         return self.data, self.data2
-        
-        
+
+
 # Conversion routines   
 def knots_to_kmh(knots):
     return (float(knots) * 1.852,' km/h')
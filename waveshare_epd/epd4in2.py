@@ -240,7 +240,12 @@ class EPD:
     def send_data(self, data):
         epdconfig.digital_write(self.dc_pin, 1)
         epdconfig.digital_write(self.cs_pin, 0)
-        epdconfig.spi_writebyte([data])
+        if isinstance(data, int):
+            epdconfig.spi_writebyte([data])
+        else:
+            # a whole parameter sequence: one transfer instead of a
+            # syscall (plus CS/DC toggles) per byte
+            epdconfig.spi_writebyte2(data)
         epdconfig.digital_write(self.cs_pin, 1)
 
     # send a lot of data   
@@ -540,14 +545,19 @@ class EPD:
         self.send_data(int(X_start * 8 / 256))
         self.send_data(int(X_start * 8 % 256))  # x-start
 
-        self.send_data(int(X_end * 8 / 256))
-        self.send_data(int(X_end * 8 % 256) - 1)  # x-end
+        # The end registers are inclusive, so encode (end - 1) as proper
+        # high/low bytes; subtracting 1 from the low byte alone underflows
+        # to -1 whenever the end lands exactly on a 256 boundary
+        x_end = X_end * 8 - 1
+        self.send_data(x_end // 256)
+        self.send_data(x_end % 256)  # x-end
 
         self.send_data(int(Y_start / 256))
         self.send_data(int(Y_start % 256))  # y-start
 
-        self.send_data(int(Y_end / 256))
-        self.send_data(int(Y_end % 256) - 1)  # y-end
+        y_end = Y_end - 1
+        self.send_data(y_end // 256)
+        self.send_data(y_end % 256)  # y-end
         self.send_data(0x28)
 
         self.send_command(0x10)  # writes Old data to SRAM for programming
@@ -560,7 +570,7 @@ class EPD:
         for j in range(0, Y_end - Y_start):
             for i in range(0, X_end - X_start):
                 buf[j * (X_end - X_start) + i] = ~Image[(Y_start + j) * Width + X_start + i]
-                self.DATA[(Y_start + j) * Width + X_start + i] = ~Image[(Y_start + j) * Width + X_start / 8 + i]
+                self.DATA[(Y_start + j) * Width + X_start + i] = ~Image[(Y_start + j) * Width + X_start + i]
         self.send_data2(buf)
 
         self.send_command(0x12)  # DISPLAY REFRESH